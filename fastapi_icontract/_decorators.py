@@ -1,8 +1,11 @@
 """Provide decorators for the endpoints."""
 
-import inspect
-import traceback
-from typing import Optional
+import functools
+import linecache
+import sys
+import types
+import weakref
+from typing import MutableMapping, Optional
 
 import fastapi
 import icontract
@@ -14,14 +17,34 @@ import fastapi_icontract.openapi
 from fastapi_icontract._globals import CallableT
 
 
+#: Cache the text of the lambda conditions by their code objects.
+#: A re-loaded module creates new code objects so that its text is inspected anew.
+_BODY_TEXT_CACHE = (
+    weakref.WeakKeyDictionary()
+)  # type: MutableMapping[types.CodeType, str]
+
+
 def _func_body_as_text(func: CallableT) -> str:
     """Represent the condition as text to be included in the specs."""
     if not icontract._represent.is_lambda(a_function=func):
         return func.__name__
 
-    lines, condition_lineno = inspect.findsource(func)
-    filename = inspect.getsourcefile(func)
-    assert filename is not None, f"Unexpected None filename for condition: {func}"
+    key = func.__code__
+    text = _BODY_TEXT_CACHE.get(key, None)
+    if text is not None:
+        return text
+
+    filename = func.__code__.co_filename
+    # NOTE: The lines are cached by ``linecache``. We need to check the cache first
+    # so that an edited and re-loaded module is not inspected with stale lines.
+    linecache.checkcache(filename)
+    # NOTE: We pass in the globals of the function so that the source can be
+    # retrieved through the loader of the module (*e.g.*, from a zip archive).
+    lines = linecache.getlines(filename, func.__globals__)
+    if len(lines) == 0:
+        raise OSError(f"Could not get the source code from: {filename}")
+
+    condition_lineno = func.__code__.co_firstlineno - 1
 
     decorator_inspection = icontract._represent.inspect_decorator(
         lines=lines, lineno=condition_lineno, filename=filename
@@ -34,9 +57,23 @@ def _func_body_as_text(func: CallableT) -> str:
         lambda_inspection is not None
     ), f"Expected lambda_inspection to be non-None if is_lambda is True on: {func}"
 
+    _BODY_TEXT_CACHE[key] = lambda_inspection.text
+
     return lambda_inspection.text
 
 
+def _caller_location() -> Optional[str]:
+    """Represent the location of the caller of the decorator's ``__init__``."""
+    try:
+        # We need to go up two frames: this function and the ``__init__``.
+        frame = sys._getframe(2)
+    except ValueError:
+        return None
+
+    code = frame.f_code
+    return f"File {code.co_filename}, line {frame.f_lineno} in {code.co_name}"
+
+
 class require:  # pylint: disable=invalid-name
     """Decorate a FastAPI endpoint with a pre-condition."""
 
@@ -95,12 +132,6 @@ class require:  # pylint: disable=invalid-name
         self._contract = None  # type: Optional[icontract._types.Contract]
 
         if enforced:
-            location = None  # type: Optional[str]
-            tb_stack = traceback.extract_stack(limit=2)[:1]
-            if len(tb_stack) > 0:
-                frame = tb_stack[0]
-                location = f"File {frame.filename}, line {frame.lineno} in {frame.name}"
-
             self._contract = icontract._types.Contract(
                 condition=condition,
                 description=description,
@@ -112,7 +143,7 @@ class require:  # pylint: disable=invalid-name
                         else None
                     ),
                 ),
-                location=location,
+                location=_caller_location(),
             )
 
     def __call__(self, func: CallableT) -> CallableT:
@@ -140,11 +171,10 @@ class require:  # pylint: disable=invalid-name
         if not self.undocument:
             openapi_contracts = fastapi_icontract.openapi.get_or_attach(func=result)
 
-            text = _func_body_as_text(func=self.condition)
             openapi_contracts.preconditions.append(
                 fastapi_icontract.openapi.Contract(
                     enforced=self.enforced,
-                    text=text,
+                    text=functools.partial(_func_body_as_text, self.condition),
                     status_code=self.status_code,
                     description=self.description,
                 )
@@ -203,14 +233,8 @@ class snapshot:  # pylint: disable=invalid-name
 
         # Resolve the snapshot only if enabled so that no overhead is incurred
         if enabled:
-            location = None  # type: Optional[str]
-            tb_stack = traceback.extract_stack(limit=2)[:1]
-            if len(tb_stack) > 0:
-                frame = tb_stack[0]
-                location = f"File {frame.filename}, line {frame.lineno} in {frame.name}"
-
             self._snapshot = icontract._types.Snapshot(
-                capture=capture, name=name, location=location
+                capture=capture, name=name, location=_caller_location()
             )
 
         self.undocument = undocument
@@ -252,10 +276,11 @@ class snapshot:  # pylint: disable=invalid-name
         if not self.undocument:
             openapi_contracts = fastapi_icontract.openapi.get_or_attach(func=result)
 
-            text = _func_body_as_text(func=self.capture)
             openapi_contracts.snapshots.append(
                 fastapi_icontract.openapi.Snapshot(
-                    name=self.name, enabled=self.enabled, text=text
+                    name=self.name,
+                    enabled=self.enabled,
+                    text=functools.partial(_func_body_as_text, self.capture),
                 )
             )
 
@@ -320,12 +345,6 @@ class ensure:  # pylint: disable=invalid-name
         self._contract = None  # type: Optional[icontract._types.Contract]
 
         if enforced:
-            location = None  # type: Optional[str]
-            tb_stack = traceback.extract_stack(limit=2)[:1]
-            if len(tb_stack) > 0:
-                frame = tb_stack[0]
-                location = f"File {frame.filename}, line {frame.lineno} in {frame.name}"
-
             self._contract = icontract._types.Contract(
                 condition=condition,
                 description=description,
@@ -337,7 +356,7 @@ class ensure:  # pylint: disable=invalid-name
                         else None
                     ),
                 ),
-                location=location,
+                location=_caller_location(),
             )
 
     def __call__(self, func: CallableT) -> CallableT:
@@ -368,11 +387,10 @@ class ensure:  # pylint: disable=invalid-name
         if not self.undocument:
             openapi_contracts = fastapi_icontract.openapi.get_or_attach(func=result)
 
-            text = _func_body_as_text(func=self.condition)
             openapi_contracts.postconditions.append(
                 fastapi_icontract.openapi.Contract(
                     enforced=self.enforced,
-                    text=text,
+                    text=functools.partial(_func_body_as_text, self.condition),
                     status_code=self.status_code,
                     description=self.description,
                 )
@@ -1,6 +1,8 @@
 """Define data structures to be added to the OpenAPI specs."""
 import functools
-from typing import List, Any, Optional, Dict
+import operator
+import weakref
+from typing import List, Any, Optional, Dict, Callable, MutableMapping, Tuple, Union
 
 import fastapi
 import fastapi.openapi.utils
@@ -11,88 +13,261 @@ from fastapi_icontract._globals import CallableT
 class Contract:
     """Describe a contract of an operation."""
 
+    __slots__ = ("enforced", "_text", "status_code", "description")
+
     def __init__(
-        self, enforced: bool, text: str, status_code: int, description: Optional[str]
+        self,
+        enforced: bool,
+        text: Union[str, Callable[[], str]],
+        status_code: int,
+        description: Optional[str],
     ) -> None:
-        """Initialize with the given values."""
+        """
+        Initialize with the given values.
+
+        The ``text`` can also be given as a function. The function is called only
+        once the text of the contract is needed so that the inspection of
+        the source code is deferred until the schema is actually generated.
+        """
         self.enforced = enforced
-        self.text = text
+        self._text = text
         self.status_code = status_code
         self.description = description
 
+    @property
+    def text(self) -> str:
+        """Represent the condition of the contract as text."""
+        if not isinstance(self._text, str):
+            self._text = self._text()
+
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        """Set the text of the contract explicitly."""
+        self._text = value
+
 
 class Snapshot:
     """Describe a snapshot involved in an operation."""
 
-    def __init__(self, name: str, enabled: bool, text: str) -> None:
-        """Initialize with the given values."""
+    __slots__ = ("name", "enabled", "_text")
+
+    def __init__(
+        self, name: str, enabled: bool, text: Union[str, Callable[[], str]]
+    ) -> None:
+        """
+        Initialize with the given values.
+
+        The ``text`` can also be given as a function which is called only once
+        the text of the snapshot is needed.
+        """
         self.name = name
         self.enabled = enabled
-        self.text = text
+        self._text = text
+
+    @property
+    def text(self) -> str:
+        """Represent the capture function of the snapshot as text."""
+        if not isinstance(self._text, str):
+            self._text = self._text()
+
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        """Set the text of the snapshot explicitly."""
+        self._text = value
 
 
 class Contracts:
     """Describe all the contracts of an operation."""
 
+    __slots__ = ("preconditions", "snapshots", "postconditions", "_jsonable_cache")
+
     def __init__(self) -> None:
         """Initialize with the empty values."""
         self.preconditions = []  # type: List[Contract]
         self.snapshots = []  # type: List[Snapshot]
         self.postconditions = []  # type: List[Contract]
 
+        # Cache the JSON-able representation once it has been computed
+        self._jsonable_cache = None  # type: Optional[Dict[str, Any]]
+
 
 def get_or_attach(func: CallableT) -> Contracts:
     """Get or create the attribute of the endpoint for the contracts."""
-    if not hasattr(func, "__fastapi_icontract_openapi__"):
-        contracts = Contracts()
+    contracts = getattr(
+        func, "__fastapi_icontract_openapi__", None
+    )  # type: Optional[Contracts]
 
-        setattr(func, "__fastapi_icontract_openapi__", contracts)
+    if contracts is None:
+        contracts = Contracts()
+        func.__fastapi_icontract_openapi__ = contracts  # type: ignore
     else:
-        contracts = getattr(func, "__fastapi_icontract_openapi__")
+        # The endpoint is decorated further so the cached representation
+        # is not valid anymore.
+        contracts._jsonable_cache = None
+
+        if isinstance(contracts.preconditions, tuple):
+            # The contracts have been frozen so we need to thaw them.
+            contracts.preconditions = list(contracts.preconditions)
+            contracts.snapshots = list(contracts.snapshots)
+            contracts.postconditions = list(contracts.postconditions)
 
     return contracts
 
 
-def _contract_to_jsonable(contract: Contract) -> Dict[str, Any]:
-    """Convert the contract to a JSON-able structure."""
-    jsonable = {
-        "enforced": contract.enforced,
-        "text": contract.text,
-        "language": "python3",
-        "statusCode": contract.status_code,
-    }
-    if contract.description:
-        jsonable["description"] = contract.description
+def _freeze(contracts: Contracts) -> None:
+    """
+    Convert the contracts to tuples as they do not change after the decoration.
 
-    return jsonable
+    If the endpoint is decorated further, the contracts are thawed again
+    in :py:func:`get_or_attach`.
+    """
+    if isinstance(contracts.preconditions, tuple):
+        return
 
+    # NOTE: We deliberately ignore the types here since the decorators append
+    # the contracts only after obtaining them from :py:func:`get_or_attach`,
+    # which thaws them beforehand.
+    contracts.preconditions = tuple(contracts.preconditions)  # type: ignore
+    contracts.snapshots = tuple(contracts.snapshots)  # type: ignore
+    contracts.postconditions = tuple(contracts.postconditions)  # type: ignore
+
+
+# Retrieve the fields of contracts and snapshots in a single call
+_CONTRACT_FIELDS = operator.attrgetter("enforced", "text", "status_code", "description")
+_SNAPSHOT_FIELDS = operator.attrgetter("name", "enabled", "text")
 
-def _snapshot_to_jsonable(snapshot: Snapshot) -> Dict[str, Any]:
-    """Convert the snapshot to a JSON-able structure."""
-    jsonable = {
-        "name": snapshot.name,
-        "enabled": snapshot.enabled,
-        "text": snapshot.text,
-        "language": "python3",
-    }
 
-    return jsonable
+def _copy_jsonable(jsonable: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy the JSON-able structure of the contracts so that it can be modified."""
+    return {key: [dict(item) for item in items] for key, items in jsonable.items()}
 
 
 def contracts_to_jsonable(contracts: Contracts) -> Dict[str, Any]:
-    """Convert the contracts to a JSON-able structure."""
-    return {
-        "preconditions": [
-            _contract_to_jsonable(contract) for contract in contracts.preconditions
-        ],
-        "snapshots": [
-            _snapshot_to_jsonable(snapshot) for snapshot in contracts.snapshots
-        ],
-        "postconditions": [
-            _contract_to_jsonable(contract) for contract in contracts.postconditions
-        ],
+    """
+    Convert the contracts to a JSON-able structure.
+
+    The structure is computed only once and cached on the ``contracts``
+    since the contracts do not change after the endpoint has been decorated.
+    A fresh copy of it is returned so that the callers can modify the result
+    without affecting the cache.
+    """
+    if contracts._jsonable_cache is not None:
+        return _copy_jsonable(contracts._jsonable_cache)
+
+    preconditions = []  # type: List[Dict[str, Any]]
+    snapshots = []  # type: List[Dict[str, Any]]
+    postconditions = []  # type: List[Dict[str, Any]]
+
+    # NOTE: We construct the JSON-able structures inline instead of delegating
+    # to helper functions since this loop dominates the schema generation for
+    # large APIs.
+    for target, contract_list in (
+        (preconditions, contracts.preconditions),
+        (postconditions, contracts.postconditions),
+    ):
+        for contract in contract_list:
+            enforced, text, status_code, description = _CONTRACT_FIELDS(contract)
+
+            jsonable = {
+                "enforced": enforced,
+                "text": text,
+                "language": "python3",
+                "statusCode": status_code,
+            }
+            if description:
+                jsonable["description"] = description
+
+            target.append(jsonable)
+
+    for snapshot in contracts.snapshots:
+        name, enabled, text = _SNAPSHOT_FIELDS(snapshot)
+
+        snapshots.append(
+            {
+                "name": name,
+                "enabled": enabled,
+                "text": text,
+                "language": "python3",
+            }
+        )
+
+    contracts._jsonable_cache = {
+        "preconditions": preconditions,
+        "snapshots": snapshots,
+        "postconditions": postconditions,
     }
 
+    return _copy_jsonable(contracts._jsonable_cache)
+
+
+def _collect_operation_contracts(app: fastapi.FastAPI) -> Dict[str, Contracts]:
+    """Map the operation IDs to the contracts of the corresponding endpoints."""
+    operation_contracts = {}  # type: Dict[str, Contracts]
+
+    for route in app.routes:
+        if (
+            not isinstance(route, fastapi.routing.APIRoute)
+            or not route.include_in_schema
+        ):
+            continue
+
+        contracts = getattr(route.endpoint, "__fastapi_icontract_openapi__", None)
+
+        if contracts is None:
+            continue
+
+        assert isinstance(contracts, Contracts)
+
+        _freeze(contracts)
+
+        if len(route.methods) == 1:
+            # NOTE: For a route with a single method, the operation ID coincides with
+            # the unique ID which FastAPI already computed when constructing the route.
+            operation_ids = [route.operation_id or route.unique_id]
+        else:
+            operation_ids = [
+                fastapi.openapi.utils.generate_operation_id(route=route, method=method)
+                for method in route.methods
+            ]
+
+        for operation_id in operation_ids:
+            assert (
+                operation_id is not None
+            ), f"Unexpected None operation ID for endpoint {route.endpoint}"
+
+            assert (
+                operation_id not in operation_contracts
+            ), f"Unexpected duplicate contracts for operation ID: {operation_id}"
+            operation_contracts[operation_id] = contracts
+
+    return operation_contracts
+
+
+#: Cache the operation contracts of an app together with the identity and
+#: the number of its routes at the time of collection so that we re-collect
+#: only if the routes changed.
+_OPERATION_CONTRACTS_CACHE = (
+    weakref.WeakKeyDictionary()
+)  # type: MutableMapping[fastapi.FastAPI, Tuple[Tuple[int, int], Dict[str, Contracts]]]
+
+
+def _get_operation_contracts(app: fastapi.FastAPI) -> Dict[str, Contracts]:
+    """Retrieve the operation contracts of the ``app`` from the cache or collect them."""
+    routes_id = (id(app.routes), len(app.routes))
+
+    cached = _OPERATION_CONTRACTS_CACHE.get(app, None)
+    if cached is not None and cached[0] == routes_id:
+        return cached[1]
+
+    operation_contracts = _collect_operation_contracts(app=app)
+    _OPERATION_CONTRACTS_CACHE[app] = (routes_id, operation_contracts)
+
+    return operation_contracts
+
 
 def wrap_openapi_with_contracts(app: fastapi.FastAPI) -> None:
     """Wrap the ``openapi`` method of the ``app`` to include the contracts in the schema."""
@@ -108,43 +283,16 @@ def wrap_openapi_with_contracts(app: fastapi.FastAPI) -> None:
 
         openapi_schema = old_openapi_func()
 
-        operation_contracts = dict()  # type: Dict[str, Contracts]
-
-        for route in app.routes:
-            if (
-                not isinstance(route, fastapi.routing.APIRoute)
-                or not route.include_in_schema
-            ):
-                continue
-
-            contracts = getattr(route.endpoint, "__fastapi_icontract_openapi__", None)
-
-            if contracts is None:
-                continue
-
-            assert isinstance(contracts, Contracts)
-
-            for method in route.methods:
-                operation_id = fastapi.openapi.utils.generate_operation_id(
-                    route=route, method=method
-                )
-
-                assert (
-                    operation_id is not None
-                ), f"Unexpected None operation ID for endpoint {route.endpoint}"
-
-                assert (
-                    operation_id not in operation_contracts
-                ), f"Unexpected duplicate contracts for operation ID: {operation_id}"
-                operation_contracts[operation_id] = contracts
+        operation_contracts = _get_operation_contracts(app=app)
 
-        # Find the operation in the schema
-        for path in openapi_schema["paths"].values():
-            for operation in path.values():
-                operation_id = operation.get("operationId", None)
-                if operation_id is not None and operation_id in operation_contracts:
-                    contracts = operation_contracts[operation_id]
-                    operation["x-contracts"] = contracts_to_jsonable(contracts)
+        if len(operation_contracts) > 0:
+            # Find the operation in the schema
+            for path in openapi_schema["paths"].values():
+                for operation in path.values():
+                    operation_id = operation.get("operationId", None)
+                    if operation_id is not None and operation_id in operation_contracts:
+                        contracts = operation_contracts[operation_id]
+                        operation["x-contracts"] = contracts_to_jsonable(contracts)
 
         # Cache
         app.openapi_schema = openapi_schema
@@ -10,24 +10,8 @@ from starlette.requests import Request
 from starlette.responses import HTMLResponse
 
 
-def get_swagger_ui_html(
-    *,
-    openapi_url: str,
-    title: str,
-    swagger_js_url: str = "https://cdn.jsdelivr.net/npm/swagger-ui-dist@3/swagger-ui-bundle.js",
-    swagger_css_url: str = "https://cdn.jsdelivr.net/npm/swagger-ui-dist@3/swagger-ui.css",
-    swagger_favicon_url: str = "https://fastapi.tiangolo.com/img/favicon.png",
-    swagger_ui_plugin_contracts_url: str = "https://unpkg.com/swagger-ui-plugin-contracts",
-    oauth2_redirect_url: Optional[str] = None,
-    init_oauth: Optional[Dict[str, Any]] = None,
-) -> HTMLResponse:
-    """
-    Generate the HTML for Swagger UI endpoint.
-
-    This is a patched version of the original fastapi.applications.get_swagger_ui_html
-    which includes a separate JavaScript code to display contracts in a pretty format.
-    """
-    html = f"""
+#: Template of the Swagger UI HTML page with the contracts plugin included
+_SWAGGER_HTML_TEMPLATE = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -44,12 +28,7 @@ def get_swagger_ui_html(
     <script>
     const ui = SwaggerUIBundle({{
         url: '{openapi_url}',
-    """
-
-    if oauth2_redirect_url:
-        html += f"oauth2RedirectUrl: window.location.origin + '{oauth2_redirect_url}',"
-
-    html += """
+    {oauth2_line}
         dom_id: '#swagger-ui',
         presets: [
             SwaggerUIBundle.presets.apis,
@@ -62,18 +41,62 @@ def get_swagger_ui_html(
         deepLinking: true,
         showExtensions: true,
         showCommonExtensions: true
-    })"""
-
-    if init_oauth:
-        html += f"""
-        ui.initOAuth({json.dumps(jsonable_encoder(init_oauth))})
-        """
-
-    html += """
+    }}){init_oauth_line}
     </script>
     </body>
     </html>
     """
+
+
+def get_swagger_ui_html(
+    *,
+    openapi_url: str,
+    title: str,
+    swagger_js_url: str = "https://cdn.jsdelivr.net/npm/swagger-ui-dist@3/swagger-ui-bundle.js",
+    swagger_css_url: str = "https://cdn.jsdelivr.net/npm/swagger-ui-dist@3/swagger-ui.css",
+    swagger_favicon_url: str = "https://fastapi.tiangolo.com/img/favicon.png",
+    swagger_ui_plugin_contracts_url: str = "https://unpkg.com/swagger-ui-plugin-contracts",
+    oauth2_redirect_url: Optional[str] = None,
+    init_oauth: Optional[Dict[str, Any]] = None,
+    init_oauth_json: Optional[str] = None,
+) -> HTMLResponse:
+    """
+    Generate the HTML for Swagger UI endpoint.
+
+    This is a patched version of the original fastapi.applications.get_swagger_ui_html
+    which includes a separate JavaScript code to display contracts in a pretty format.
+
+    If ``init_oauth_json`` is given, it is used as the already JSON-encoded
+    ``init_oauth`` so that the encoding does not need to be repeated on every request.
+    """
+    if init_oauth_json is None and init_oauth:
+        init_oauth_json = json.dumps(jsonable_encoder(init_oauth))
+
+    oauth2_line = (
+        f"oauth2RedirectUrl: window.location.origin + '{oauth2_redirect_url}',"
+        if oauth2_redirect_url
+        else ""
+    )
+
+    init_oauth_line = (
+        f"""
+        ui.initOAuth({init_oauth_json})
+        """
+        if init_oauth_json
+        else ""
+    )
+
+    html = _SWAGGER_HTML_TEMPLATE.format(
+        swagger_css_url=swagger_css_url,
+        swagger_favicon_url=swagger_favicon_url,
+        title=title,
+        swagger_js_url=swagger_js_url,
+        swagger_ui_plugin_contracts_url=swagger_ui_plugin_contracts_url,
+        openapi_url=openapi_url,
+        oauth2_line=oauth2_line,
+        init_oauth_line=init_oauth_line,
+    )
+
     return HTMLResponse(html)
 
 
@@ -90,13 +113,17 @@ def set_up_route_for_docs_with_contracts_plugin(
 
         app = FastAPI(docs_url=None)
     """
+    # Inspect the routes in a single pass for both the docs and the OAuth2 redirect
+    oauth2_already_set_up = False
+
     for route in app.routes:
-        if not isinstance(route, fastapi.routing.APIRoute):
+        if (
+            not isinstance(route, fastapi.routing.APIRoute)
+            or "GET" not in route.methods
+        ):
             continue
 
-        assert isinstance(route, fastapi.routing.APIRoute)
-
-        if route.path == path and "GET" in route.methods:
+        if route.path == path:
             raise ValueError(
                 f"The FastAPI app {app} has already the route with the method 'GET' set up for "
                 f"{path!r}. "
@@ -104,6 +131,12 @@ def set_up_route_for_docs_with_contracts_plugin(
                 f"an alternative Swagger UI with contracts plugin."
             )
 
+        if (
+            app.swagger_ui_oauth2_redirect_url
+            and route.path == app.swagger_ui_oauth2_redirect_url
+        ):
+            oauth2_already_set_up = True
+
     if app.openapi_url is None:
         raise ValueError(
             f"The FastAPI app {app} has the OpenAPI URL set to None. "
@@ -113,57 +146,63 @@ def set_up_route_for_docs_with_contracts_plugin(
 
     # The part below has been adapted from fastapi.applications.FastAPI.setup()
 
+    # Encode the OAuth2 initialization only once instead of on every request
+    init_oauth_json = (
+        json.dumps(jsonable_encoder(app.swagger_ui_init_oauth))
+        if app.swagger_ui_init_oauth
+        else None
+    )
+
+    # Without a root path set by a proxy, the page is always the same so we render
+    # it only once.
+    cached_body = get_swagger_ui_html(
+        openapi_url=app.openapi_url,
+        title=app.title + " - Swagger UI",
+        oauth2_redirect_url=app.swagger_ui_oauth2_redirect_url,
+        init_oauth_json=init_oauth_json,
+    ).body
+
     async def swagger_ui_html(req: Request) -> HTMLResponse:
-        root_path = req.scope.get("root_path", "").rstrip("/")
+        root_path = req.scope.get("root_path", "")
+        if root_path == "":
+            return HTMLResponse(content=cached_body)
+
+        root_path = root_path.rstrip("/")
         openapi_url = root_path + app.openapi_url
         oauth2_redirect_url = app.swagger_ui_oauth2_redirect_url
         if oauth2_redirect_url:
             oauth2_redirect_url = root_path + oauth2_redirect_url
+
         return get_swagger_ui_html(
             openapi_url=openapi_url,
             title=app.title + " - Swagger UI",
             oauth2_redirect_url=oauth2_redirect_url,
-            init_oauth=app.swagger_ui_init_oauth,
+            init_oauth_json=init_oauth_json,
         )
 
     app.add_route(path, swagger_ui_html, include_in_schema=False)
 
-    if app.swagger_ui_oauth2_redirect_url:
-        oauth2_already_set_up = False
-
-        for route in app.routes:
-            if not isinstance(route, fastapi.routing.APIRoute):
-                continue
-
-            assert isinstance(route, fastapi.routing.APIRoute)
-
-            if (
-                route.path == app.swagger_ui_oauth2_redirect_url
-                and "GET" in route.methods
-            ):
-                oauth2_already_set_up = True
-
-        if not oauth2_already_set_up:
-            # We need to set up the Oauth2 route if it has not been already set since
-            # it will be not automatically set in app.setup().
-            #
-            # Here is the relevant part of the app.setup() implementation:
-            #
-            # .. code-block:: python
-            #
-            #     if self.openapi_url and self.docs_url:
-            #         ...
-            #         if self.swagger_ui_oauth2_redirect_url:
-            #             ...
-            #
-
-            async def swagger_ui_redirect(
-                req: Request,  # pylint: disable=unused-argument
-            ) -> HTMLResponse:
-                return fastapi.openapi.docs.get_swagger_ui_oauth2_redirect_html()
-
-            app.add_route(
-                app.swagger_ui_oauth2_redirect_url,
-                swagger_ui_redirect,
-                include_in_schema=False,
-            )
+    if app.swagger_ui_oauth2_redirect_url and not oauth2_already_set_up:
+        # We need to set up the Oauth2 route if it has not been already set since
+        # it will be not automatically set in app.setup().
+        #
+        # Here is the relevant part of the app.setup() implementation:
+        #
+        # .. code-block:: python
+        #
+        #     if self.openapi_url and self.docs_url:
+        #         ...
+        #         if self.swagger_ui_oauth2_redirect_url:
+        #             ...
+        #
+
+        async def swagger_ui_redirect(
+            req: Request,  # pylint: disable=unused-argument
+        ) -> HTMLResponse:
+            return fastapi.openapi.docs.get_swagger_ui_oauth2_redirect_html()
+
+        app.add_route(
+            app.swagger_ui_oauth2_redirect_url,
+            swagger_ui_redirect,
+            include_in_schema=False,
+        )
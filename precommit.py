@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 """Run pre-commit checks on the repository."""
 import argparse
+import concurrent.futures
 import enum
 import os
 import pathlib
+import signal
 import subprocess
 import sys
+import threading
+from typing import Any, FrozenSet, List, Mapping, Optional, Sequence, Set, Tuple
 
 
 class Step(enum.Enum):
@@ -19,8 +23,109 @@ class Step(enum.Enum):
     CHECK_HELP_IN_DOC = "check-help-in-doc"
 
 
+class Job:
+    """Represent the commands of a step to be executed one after another."""
+
+    def __init__(
+        self,
+        step: Step,
+        commands: Sequence[Sequence[str]],
+        env: Optional[Mapping[str, str]] = None,
+        exclusive: bool = False,
+    ) -> None:
+        """
+        Initialize with the given values.
+
+        If ``exclusive`` is set, the job is not run concurrently with the other
+        jobs since it runs its commands in parallel by itself.
+        """
+        self.step = step
+        self.commands = commands
+        self.env = env
+        self.exclusive = exclusive
+
+
+class Runner:
+    """Run the jobs while keeping track of the running processes."""
+
+    def __init__(self, cwd: pathlib.Path) -> None:
+        """Initialize with the working directory of the commands."""
+        self.cwd = cwd
+        # The lock is re-entrant since the interrupt handler might cancel
+        # the runner in the main thread while the main thread holds the lock.
+        self._lock = threading.RLock()
+        self._processes = set()  # type: Set[subprocess.Popen[str]]
+        self._terminated = set()  # type: Set[subprocess.Popen[str]]
+        self._cancelled = False
+
+    def run_job(self, job: Job) -> Tuple[Optional[int], str]:
+        """
+        Run the commands of the ``job`` and capture their output.
+
+        The execution stops at the first failed command, or if the runner
+        has been cancelled in the meanwhile.
+
+        :return:
+            exit code of the last executed command, or None if the job has been
+            cancelled, and the combined output
+        """
+        outputs = []  # type: List[str]
+        for cmd in job.commands:
+            with self._lock:
+                if self._cancelled:
+                    return None, "".join(outputs)
+
+                proc = subprocess.Popen(
+                    cmd,
+                    cwd=str(self.cwd),
+                    env=job.env,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    universal_newlines=True,
+                    # Each command runs in its own process group so that we can
+                    # terminate it together with its sub-processes on cancellation.
+                    start_new_session=True,
+                )
+                self._processes.add(proc)
+
+            try:
+                stdout, _ = proc.communicate()
+            finally:
+                with self._lock:
+                    self._processes.discard(proc)
+
+            outputs.append(stdout)
+
+            if proc.returncode != 0:
+                if proc in self._terminated:
+                    return None, "".join(outputs)
+
+                return proc.returncode, "".join(outputs)
+
+        return 0, "".join(outputs)
+
+    def cancel(self) -> None:
+        """Prevent new commands from starting and terminate the running ones."""
+        with self._lock:
+            self._cancelled = True
+            for proc in self._processes:
+                self._terminated.add(proc)
+                try:
+                    if hasattr(os, "killpg"):
+                        os.killpg(proc.pid, signal.SIGTERM)
+                    else:
+                        proc.terminate()
+                except ProcessLookupError:
+                    # The process exited in the meanwhile.
+                    pass
+
+
 def main() -> int:
     """Execute entry_point routine."""
+    # The steps are listed in the same way for both --select and --skip.
+    step_values_str = " ".join(value.value for value in Step)
+    step_choices = [value.value for value in Step]
+
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
         "--overwrite",
@@ -33,12 +138,11 @@ def main() -> int:
             "If set, only the selected steps are executed. "
             "This is practical if some of the steps failed and you want to "
             "fix them in isolation. "
-            "The steps are given as a space-separated list of: "
-            + " ".join(value.value for value in Step)
+            "The steps are given as a space-separated list of: " + step_values_str
         ),
         metavar="",
         nargs="+",
-        choices=[value.value for value in Step],
+        choices=step_choices,
     )
     parser.add_argument(
         "--skip",
@@ -46,12 +150,17 @@ def main() -> int:
             "If set, skips the specified steps. "
             "This is practical if some of the steps passed and "
             "you want to fix the remainder in isolation. "
-            "The steps are given as a space-separated list of: "
-            + " ".join(value.value for value in Step)
+            "The steps are given as a space-separated list of: " + step_values_str
         ),
         metavar="",
         nargs="+",
-        choices=[value.value for value in Step],
+        choices=step_choices,
+    )
+
+    parser.add_argument(
+        "--fail-fast",
+        help="If set, cancel the remaining steps as soon as one of the steps failed.",
+        action="store_true",
     )
 
     args = parser.parse_args()
@@ -59,16 +168,25 @@ def main() -> int:
     overwrite = bool(args.overwrite)
 
     selects = (
-        [Step(value) for value in args.select]
+        frozenset(map(Step, args.select))
         if args.select is not None
-        else [value for value in Step]
-    )
-    skips = [Step(value) for value in args.skip] if args.skip is not None else []
+        else frozenset(Step)
+    )  # type: FrozenSet[Step]
+    skips = (
+        frozenset(map(Step, args.skip)) if args.skip is not None else frozenset()
+    )  # type: FrozenSet[Step]
+
+    def should_run(step: Step) -> bool:
+        """Check whether the ``step`` has been selected and not skipped."""
+        return step in selects and step not in skips
 
     repo_root = pathlib.Path(__file__).parent
 
-    if Step.BLACK in selects and Step.BLACK not in skips:
-        print("Black'ing...")
+    # NOTE: The steps do not touch each other's outputs so that we can run them
+    # concurrently. The commands of a single step are executed sequentially.
+    jobs = []  # type: List[Job]
+
+    if should_run(Step.BLACK):
         # fmt: off
         black_targets = [
             "fastapi_icontract",
@@ -79,62 +197,72 @@ def main() -> int:
         # fmt: on
 
         if overwrite:
-            subprocess.check_call(["black"] + black_targets, cwd=str(repo_root))
+            jobs.append(Job(Step.BLACK, [["black"] + black_targets]))
         else:
-            subprocess.check_call(
-                ["black", "--check"] + black_targets, cwd=str(repo_root)
-            )
+            jobs.append(Job(Step.BLACK, [["black", "--check"] + black_targets]))
     else:
         print("Skipped black'ing.")
 
-    if Step.MYPY in selects and Step.MYPY not in skips:
-        print("Mypy'ing...")
+    if should_run(Step.MYPY):
         # fmt: off
         mypy_targets = ["fastapi_icontract", "tests"]
-        subprocess.check_call(["mypy", "--strict"] + mypy_targets, cwd=str(repo_root))
+        jobs.append(Job(Step.MYPY, [["mypy", "--strict"] + mypy_targets]))
         # fmt: on
     else:
         print("Skipped mypy'ing.")
 
-    if Step.PYLINT in selects and Step.PYLINT not in skips:
+    if should_run(Step.PYLINT):
         # fmt: off
-        print("Pylint'ing...")
         pylint_targets = ["fastapi_icontract"]
-        subprocess.check_call(
-            ["pylint", "--rcfile=pylint.rc"] + pylint_targets, cwd=str(repo_root)
+
+        # Pylint spawns one worker per core with ``-j 0``. The ``duplicate-code``
+        # check, which is unreliable in the parallel mode, is disabled in pylint.rc.
+        # You can still set PYLINT_JOBS to pin the number of workers.
+        pylint_jobs = os.environ.get("PYLINT_JOBS", "0")
+
+        jobs.append(
+            Job(
+                Step.PYLINT,
+                [
+                    ["pylint", "-j", pylint_jobs, "--rcfile=pylint.rc"]
+                    + pylint_targets
+                ],
+                # A single pylint worker can share the CPUs with the other steps.
+                exclusive=pylint_jobs != "1"
+            )
         )
         # fmt: on
     else:
         print("Skipped pylint'ing.")
 
-    if Step.PYDOCSTYLE in selects and Step.PYDOCSTYLE not in skips:
-        print("Pydocstyle'ing...")
-        subprocess.check_call(["pydocstyle", "fastapi_icontract"], cwd=str(repo_root))
+    if should_run(Step.PYDOCSTYLE):
+        jobs.append(Job(Step.PYDOCSTYLE, [["pydocstyle", "fastapi_icontract"]]))
     else:
         print("Skipped pydocstyle'ing.")
 
-    if Step.TEST in selects and Step.TEST not in skips:
-        print("Testing...")
-        env = os.environ.copy()
-        env["ICONTRACT_SLOW"] = "true"
+    if should_run(Step.TEST):
+        env = {**os.environ, "ICONTRACT_SLOW": "true"}
 
         # fmt: off
-        subprocess.check_call(
-            [
-                "coverage", "run",
-                "--source", "fastapi_icontract",
-                "-m", "unittest", "discover"
-            ],
-            cwd=str(repo_root),
-            env=env,
+        jobs.append(
+            Job(
+                Step.TEST,
+                [
+                    [
+                        "coverage", "run",
+                        "--source", "fastapi_icontract",
+                        "-m", "unittest", "discover"
+                    ],
+                    ["coverage", "report"]
+                ],
+                env=env
+            )
         )
         # fmt: on
-
-        subprocess.check_call(["coverage", "report"])
     else:
         print("Skipped testing.")
 
-    if Step.DOCTEST in selects and Step.DOCTEST not in skips:
+    if should_run(Step.DOCTEST):
         # We doctest the documentation in a separate step from testing so that
         # the two steps can run in isolation.
         #
@@ -143,19 +271,31 @@ def main() -> int:
         # but this is not desirable as tests can take quite long to run.
         # This would slow down the development if all we want is to iterate
         # on documentation doctests.
-        print("Doctesting...")
-        for pth in (repo_root / "doc").glob("**/*.rst"):
-            subprocess.check_call([sys.executable, "-m", "doctest", str(pth)])
-        subprocess.check_call([sys.executable, "-m", "doctest", "README.rst"])
+        #
+        # All the files are doctested in a single interpreter since
+        # the interpreter start-up dominates the time for small files.
+        doctest_paths = []  # type: List[str]
+        for dirpath, _, filenames in os.walk(str(repo_root / "doc")):
+            doctest_paths.extend(
+                os.path.join(dirpath, filename)
+                for filename in filenames
+                if filename.endswith(".rst")
+            )
+        doctest_paths.append("README.rst")
+
+        jobs.append(
+            Job(Step.DOCTEST, [[sys.executable, "-m", "doctest"] + doctest_paths])
+        )
     else:
         print("Skipped doctesting.")
 
-    if (
-        Step.CHECK_INIT_AND_SETUP_COINCIDE in selects
-        and Step.CHECK_INIT_AND_SETUP_COINCIDE not in skips
-    ):
-        print("Checking that fastapi_icontract/__init__.py and setup.py coincide...")
-        subprocess.check_call([sys.executable, "check_init_and_setup_coincide.py"])
+    if should_run(Step.CHECK_INIT_AND_SETUP_COINCIDE):
+        jobs.append(
+            Job(
+                Step.CHECK_INIT_AND_SETUP_COINCIDE,
+                [[sys.executable, "check_init_and_setup_coincide.py"]],
+            )
+        )
     else:
         print(
             "Skipped checking that fastapi_icontract/__init__.py and "
@@ -167,17 +307,12 @@ def main() -> int:
     # between the versions. Hence we pin it at the moment to Python 3.8.
 
     if (3, 7) < sys.version_info < (3, 9):
-        if Step.CHECK_HELP_IN_DOC in selects and Step.CHECK_HELP_IN_DOC not in skips:
+        if should_run(Step.CHECK_HELP_IN_DOC):
             cmd = [sys.executable, "check_help_in_doc.py"]
             if overwrite:
                 cmd.append("--overwrite")
 
-            if not overwrite:
-                print("Checking that --help's and the readme coincide...")
-            else:
-                print("Overwriting the --help's in the readme...")
-
-            subprocess.check_call(cmd, cwd=str(repo_root))
+            jobs.append(Job(Step.CHECK_HELP_IN_DOC, [cmd]))
         else:
             print("Skipped checking that --help's and the doc coincide.")
     else:
@@ -186,6 +321,113 @@ def main() -> int:
             "since we pin it on Python version 3.8."
         )
 
+    runner = Runner(cwd=repo_root)
+
+    # The commands run in their own sessions and hence do not receive
+    # the interrupt from the terminal, so we need to propagate it ourselves.
+    interrupted = threading.Event()
+
+    def handle_interrupt(
+        signum: int, frame: Any  # pylint: disable=unused-argument
+    ) -> None:
+        print("Interrupted, terminating the running steps...", file=sys.stderr)
+        interrupted.set()
+        runner.cancel()
+
+    signal.signal(signal.SIGINT, handle_interrupt)
+
+    if overwrite:
+        # The other steps need to inspect the re-formatted code, so we have to
+        # re-format it first.
+        blacks = [job for job in jobs if job.step == Step.BLACK]
+        jobs = [job for job in jobs if job.step != Step.BLACK]
+
+        for job in blacks:
+            print("Black'ing...")
+            returncode, output = runner.run_job(job=job)
+            print(output, end="")
+            if returncode != 0:
+                return 1
+
+    failed_steps = []  # type: List[Step]
+    cancelled_steps = []  # type: List[Step]
+
+    def report(job: Job, returncode: Optional[int], output: str) -> None:
+        """Print the ``output`` of the ``job`` and record its outcome."""
+        # Print the output of a step at once so that the outputs of
+        # different steps do not interleave.
+        if returncode is None:
+            print(f"[{job.step.value}] has been cancelled.")
+        else:
+            print(f"[{job.step.value}] finished with the exit code {returncode}.")
+
+        if output:
+            print(output, end="" if output.endswith("\n") else "\n")
+
+        if returncode is None:
+            cancelled_steps.append(job.step)
+        elif returncode != 0:
+            failed_steps.append(job.step)
+
+    # The exclusive jobs parallelize themselves, so we run them one after another
+    # once the concurrent jobs finished to keep only one level of parallelism.
+    exclusive_jobs = [job for job in jobs if job.exclusive]
+    jobs = [job for job in jobs if not job.exclusive]
+
+    if len(jobs) > 0:
+        print(
+            "Running concurrently: "
+            + ", ".join(job.step.value for job in jobs)
+            + " ..."
+        )
+
+    # We run at most as many steps at once as there are cores since the steps
+    # are CPU-bound.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(1, min(len(jobs), os.cpu_count() or 1))
+    ) as executor:
+        future_to_job = {executor.submit(runner.run_job, job): job for job in jobs}
+
+        for future in concurrent.futures.as_completed(future_to_job):
+            job = future_to_job[future]
+            if future.cancelled():
+                cancelled_steps.append(job.step)
+                continue
+
+            returncode, output = future.result()
+            report(job=job, returncode=returncode, output=output)
+
+            if returncode is not None and returncode != 0 and args.fail_fast:
+                for another_future in future_to_job:
+                    another_future.cancel()
+
+                runner.cancel()
+
+    for job in exclusive_jobs:
+        print(f"Running {job.step.value} ...")
+        returncode, output = runner.run_job(job=job)
+        report(job=job, returncode=returncode, output=output)
+
+        if returncode is not None and returncode != 0 and args.fail_fast:
+            runner.cancel()
+
+    if len(failed_steps) > 0:
+        print(
+            "The following steps failed: "
+            + ", ".join(step.value for step in failed_steps),
+            file=sys.stderr,
+        )
+
+    if len(cancelled_steps) > 0:
+        print(
+            "The following steps have been cancelled: "
+            + ", ".join(step.value for step in cancelled_steps),
+            file=sys.stderr,
+        )
+
+    if interrupted.is_set() or len(failed_steps) > 0:
+        return 1
+
     return 0
 
 
@@ -7,7 +7,7 @@ https://github.com/pypa/sampleproject
 import os
 import sys
 
-from setuptools import setup, find_packages
+from setuptools import setup
 
 # pylint: disable=redefined-builtin
 
@@ -17,7 +17,11 @@ with open(os.path.join(here, "README.rst"), encoding="utf-8") as fid:
     long_description = fid.read()  # pylint: disable=invalid-name
 
 with open(os.path.join(here, "requirements.txt"), encoding="utf-8") as fid:
-    install_requires = [line for line in fid.read().splitlines() if line.strip()]
+    install_requires = [
+        line.strip()
+        for line in fid
+        if line.strip() and not line.lstrip().startswith("#")
+    ]
 
 setup(
     name="fastapi-icontract",
@@ -39,7 +43,7 @@ setup(
     ],
     license="License :: OSI Approved :: MIT License",
     keywords="design-by-contract contracts automatic testing property-based",
-    packages=find_packages(exclude=["tests"]),
+    packages=["fastapi_icontract"],
     install_requires=install_requires,
     # fmt: off
     extras_require={
@@ -57,7 +61,6 @@ setup(
         ],
     },
     # fmt: on
-    py_modules=["fastapi_icontract"],
     package_data={"fastapi_icontract": ["py.typed"]},
     data_files=[(".", ["LICENSE", "README.rst", "requirements.txt"])],
 )
@@ -1,5 +1,9 @@
 """Implement the example from the readme."""
-from typing import List, TypeVar, Iterable, Awaitable, Callable, AsyncIterable, Any
+import asyncio
+from collections import defaultdict
+from typing import (
+    List, TypeVar, Iterable, Awaitable, Callable, AsyncIterable, Any, Dict,
+    DefaultDict)
 
 import uvicorn
 from fastapi import FastAPI
@@ -10,7 +14,7 @@ import fastapi_icontract
 
 app = FastAPI(docs_url=None)
 
-# The functions ``async_apply`` and ``await_each`` are copy/pasted
+# The functions ``async_apply`` and ``await_each`` are adapted
 # from asyncstdlib which are to appear in the next release.
 
 T = TypeVar('T')
@@ -19,10 +23,17 @@ T = TypeVar('T')
 async def async_apply(
         __func: Callable[..., T], *args: Awaitable[Any], **kwargs: Awaitable[Any]
 ) -> T:
-    """Await the arguments and keyword arguments and then apply ``func`` on them."""
-    return __func(
-        *[await arg for arg in args], **{k: await arg for k, arg in kwargs.items()}
+    """
+    Await the arguments and keyword arguments and then apply ``func`` on them.
+
+    The arguments are awaited concurrently since they are independent of each other.
+    """
+    arg_values = await asyncio.gather(*args) if args else []
+    kwarg_keys = list(kwargs)
+    kwarg_values = (
+        await asyncio.gather(*(kwargs[key] for key in kwarg_keys)) if kwarg_keys else []
     )
+    return __func(*arg_values, **dict(zip(kwarg_keys, kwarg_values)))
 
 
 async def await_each(awaitables: Iterable[Awaitable[T]]) -> AsyncIterable[T]:
@@ -62,16 +73,43 @@ BOOKS = [
     Book(identifier="Pride and Prejudice", author="Jane Austen", category="romance")
 ]
 
+# We index the books so that the probes used in the contracts are O(1).
+_by_identifier = dict()  # type: Dict[str, Book]
+_by_author = defaultdict(list)  # type: DefaultDict[str, List[Book]]
+_by_category = defaultdict(list)  # type: DefaultDict[str, List[Book]]
+
+
+def _index(book: Book) -> None:
+    """Add the ``book`` to the indices."""
+    _by_identifier[book.identifier] = book
+    _by_author[book.author].append(book)
+    _by_category[book.category].append(book)
+
+
+def _move(
+        index: DefaultDict[str, List[Book]], book: Book, old_key: str, new_key: str
+) -> None:
+    """Move the ``book`` from ``old_key`` to ``new_key`` in the ``index``."""
+    index[old_key].remove(book)
+    if not index[old_key]:
+        del index[old_key]
+
+    index[new_key].append(book)
+
+
+for _book in BOOKS:
+    _index(_book)
+
 
 @app.get("/has_author", response_model=bool)
 async def has_author(identifier: str) -> Any:
     """Check if the author exists in the database."""
-    return identifier in {book.author for book in BOOKS}
+    return identifier in _by_author
 
 
 @app.get("/has_category", response_model=bool)
 async def has_category(category: str) -> Any:
-    return category in {book.category for book in BOOKS}
+    return category in _by_category
 
 
 @app.get("/books_in_category", response_model=List[Book])
@@ -86,14 +124,13 @@ async def has_category(category: str) -> Any:
 )
 async def books_in_category(category: str) -> Any:
     """Retrieve the books of the given category from the database."""
-    result = [book for book in BOOKS if book.category == category]
-    return result
+    return list(_by_category.get(category, ()))
 
 
 @app.get("/has_book", response_model=bool)
 async def has_book(book_id: str) -> Any:
     """Check whether the book exists."""
-    return book_id in [book.identifier for book in BOOKS]
+    return book_id in _by_identifier
 
 
 @app.get("/book_count", response_model=int)
@@ -113,14 +150,21 @@ async def book_count() -> Any:
                 else OLD.book_count == a_book_count),
         book_count()))
 async def add_book(book: Book) -> None:
-    existing_book = next(
-        (a_book for a_book in BOOKS if a_book.identifier == book.identifier), None)
+    existing_book = _by_identifier.get(book.identifier, None)
 
     if existing_book:
-        existing_book.author = book.author
-        existing_book.category = book.category
+        # We re-index the book only on change so that the order of the books
+        # in the indices is kept otherwise.
+        if existing_book.author != book.author:
+            _move(_by_author, existing_book, existing_book.author, book.author)
+            existing_book.author = book.author
+
+        if existing_book.category != book.category:
+            _move(_by_category, existing_book, existing_book.category, book.category)
+            existing_book.category = book.category
     else:
         BOOKS.append(book)
+        _index(book)
 
 
 fastapi_icontract.wrap_openapi_with_contracts(app=app)
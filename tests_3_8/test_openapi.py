@@ -0,0 +1,136 @@
+import unittest
+from typing import Any
+
+import fastapi
+import httpx
+
+import fastapi_icontract
+import fastapi_icontract.openapi
+
+
+class TestContractText(unittest.TestCase):
+    def test_text_given_directly(self) -> None:
+        contract = fastapi_icontract.openapi.Contract(
+            enforced=True, text="x > 0", status_code=422, description=None)
+
+        self.assertEqual("x > 0", contract.text)
+
+    def test_text_given_as_function(self) -> None:
+        snapshot = fastapi_icontract.openapi.Snapshot(
+            name="x", enabled=True, text=lambda: "x")
+
+        self.assertEqual("x", snapshot.text)
+
+
+class TestUninspectableCondition(unittest.IsolatedAsyncioTestCase):
+    async def test_error_deferred_to_schema_generation(self) -> None:
+        app = fastapi.FastAPI()
+
+        # The lambda is not given in the decorator so that its text can not be
+        # inspected.
+        is_positive = lambda x: x > 0
+
+        # The decoration must succeed since the text is inspected lazily.
+        @app.get("/some_endpoint")
+        @fastapi_icontract.require(is_positive)
+        async def some_endpoint(x: int) -> Any:
+            return x
+
+        fastapi_icontract.wrap_openapi_with_contracts(app=app)
+
+        async with httpx.AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.get("/some_endpoint", params={"x": 1})
+            self.assertEqual(200, response.status_code)
+
+        with self.assertRaises(SyntaxError):
+            app.openapi()
+
+
+class TestDecorationAfterSchema(unittest.TestCase):
+    def test_contracts_added_after_schema_generation(self) -> None:
+        app = fastapi.FastAPI()
+
+        @fastapi_icontract.require(lambda x: x > 0)
+        async def some_endpoint(x: int) -> Any:
+            return x
+
+        app.get("/some_endpoint")(some_endpoint)
+
+        fastapi_icontract.wrap_openapi_with_contracts(app=app)
+        schema = app.openapi()
+        assert schema is not None
+
+        x_contracts = schema["paths"]["/some_endpoint"]["get"]["x-contracts"]
+        self.assertEqual(1, len(x_contracts["preconditions"]))
+        self.assertEqual(0, len(x_contracts["postconditions"]))
+
+        # The contracts have been frozen by the schema generation, but the endpoint
+        # is decorated further.
+        def result_is_positive(result: int) -> bool:
+            return result > 0
+
+        decorated = fastapi_icontract.ensure(result_is_positive)(some_endpoint)
+        self.assertIs(some_endpoint, decorated)
+
+        app.openapi_schema = None
+        schema = app.openapi()
+        assert schema is not None
+
+        x_contracts = schema["paths"]["/some_endpoint"]["get"]["x-contracts"]
+        self.assertListEqual(
+            ["x > 0"], [contract["text"] for contract in x_contracts["preconditions"]])
+        self.assertListEqual(
+            ["result_is_positive"],
+            [contract["text"] for contract in x_contracts["postconditions"]])
+
+        # The endpoint is decorated yet again after the schema has been re-generated.
+        def result_is_small(result: int) -> bool:
+            return result < 100
+
+        fastapi_icontract.ensure(result_is_small)(some_endpoint)
+
+        app.openapi_schema = None
+        schema = app.openapi()
+        assert schema is not None
+
+        x_contracts = schema["paths"]["/some_endpoint"]["get"]["x-contracts"]
+        self.assertListEqual(
+            ["result_is_positive", "result_is_small"],
+            [contract["text"] for contract in x_contracts["postconditions"]])
+
+
+class TestRoutesAddedAfterSchema(unittest.TestCase):
+    def test_contracts_of_new_route_included(self) -> None:
+        app = fastapi.FastAPI()
+
+        @app.get("/first")
+        @fastapi_icontract.require(lambda x: x > 0)
+        async def first(x: int) -> Any:
+            return x
+
+        fastapi_icontract.wrap_openapi_with_contracts(app=app)
+        schema = app.openapi()
+        assert schema is not None
+        self.assertNotIn("/second", schema["paths"])
+
+        # The cached operation contracts need to be invalidated as a new route
+        # is added.
+        @app.get("/second")
+        @fastapi_icontract.require(lambda y: y < 0)
+        async def second(y: int) -> Any:
+            return y
+
+        app.openapi_schema = None
+        schema = app.openapi()
+        assert schema is not None
+
+        for path, expected_text in [("/first", "x > 0"), ("/second", "y < 0")]:
+            x_contracts = schema["paths"][path]["get"]["x-contracts"]
+            self.assertListEqual(
+                [expected_text],
+                [contract["text"] for contract in x_contracts["preconditions"]],
+                f"While checking the path: {path}")
+
+
+if __name__ == '__main__':
+    unittest.main()
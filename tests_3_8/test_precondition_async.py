@@ -72,17 +72,18 @@ class TestTable(unittest.IsolatedAsyncioTestCase):
              "Pre-condition violated: Something.")
         ]  # type: List[Tuple[str, int, Optional[str]]]
 
-        for route, expected_status_code, expected_detail in table:
-            async with httpx.AsyncClient(app=app, base_url="http://test") as ac:
+        async with httpx.AsyncClient(app=app, base_url="http://test") as ac:
+            for route, expected_status_code, expected_detail in table:
                 response = await ac.get(route)
 
                 self.assertEqual(
                     expected_status_code, response.status_code,
                     f"While testing the route: {route}")
 
-                detail = None  # type: Optional[str]
-                if response.json() and "detail" in response.json():
-                    detail = response.json()["detail"]
+                body = response.json()
+                detail = (
+                    body.get("detail") if isinstance(body, dict) else None
+                )  # type: Optional[str]
 
                 self.assertEqual(expected_detail, detail,
                                  f"While testing the route: {route}")
@@ -59,8 +59,8 @@ class TestTable(unittest.IsolatedAsyncioTestCase):
             ("/snapshot_not_enforced", 200),
         ]  # type: List[Tuple[str, int]]
 
-        for route, expected_status_code in table:
-            async with httpx.AsyncClient(app=app, base_url="http://test") as ac:
+        async with httpx.AsyncClient(app=app, base_url="http://test") as ac:
+            for route, expected_status_code in table:
                 response = await ac.post(route, json=[1, 2, 3])
 
                 self.assertEqual(
@@ -0,0 +1,41 @@
+import unittest
+
+import fastapi
+import httpx
+
+import fastapi_icontract
+
+
+class TestDocsWithRootPath(unittest.IsolatedAsyncioTestCase):
+    async def test_the_content(self) -> None:
+        app = fastapi.FastAPI(
+            docs_url=None,
+            swagger_ui_init_oauth={"clientId": "some-client"})
+
+        fastapi_icontract.set_up_route_for_docs_with_contracts_plugin(app=app)
+
+        transport = httpx.ASGITransport(
+            app=app, root_path="/api/v1/")  # type: ignore
+        async with httpx.AsyncClient(
+                transport=transport, base_url="http://test") as ac:
+            # We request the page twice to make sure that it is rendered
+            # consistently behind the root path.
+            texts = []
+            for _ in range(2):
+                response = await ac.get("/docs")
+                self.assertEqual(200, response.status_code)
+                texts.append(response.text)
+
+        self.assertEqual(texts[0], texts[1])
+
+        text = texts[0]
+        self.assertIn("url: '/api/v1/openapi.json',", text)
+        self.assertIn(
+            "oauth2RedirectUrl: window.location.origin + "
+            "'/api/v1/docs/oauth2-redirect',",
+            text)
+        self.assertIn('ui.initOAuth({"clientId": "some-client"})', text)
+
+
+if __name__ == '__main__':
+    unittest.main()